@@ -156,9 +156,11 @@ class Adam(Optimizer):
         """Perform a simple Adam GD step."""
         m = (1 - params.beta_1) * grads + params.beta_1 * state.m
         v = (1 - params.beta_2) * (grads ** 2) + params.beta_2 * state.v
-        mhat = m / (1 - params.beta_1 ** (state.gen_counter + 1))
-        vhat = v / (1 - params.beta_2 ** (state.gen_counter + 1))
-        mean_new = mean - state.lrate * mhat / (jnp.sqrt(vhat) + params.eps)
+        # Fold bias corrections into scalars - avoids materializing mhat/vhat
+        bias_1 = 1 - params.beta_1 ** (state.gen_counter + 1)
+        bias_2 = jnp.sqrt(1 - params.beta_2 ** (state.gen_counter + 1))
+        step_size = state.lrate * bias_2 / bias_1
+        mean_new = mean - step_size * m / (jnp.sqrt(v) + params.eps * bias_2)
         return mean_new, state.replace(
             m=m, v=v, gen_counter=state.gen_counter + 1
         )
@@ -167,8 +167,8 @@ class OpenES(Strategy):
             rng,
             (int(self.popsize / (2 * self.n_devices)), self.num_dims),
         )
-        z = jnp.concatenate([z_plus, -1.0 * z_plus])
-        x = mean + sigma * z
+        scaled_z = sigma * z_plus
+        x = jnp.concatenate([mean + scaled_z, mean - scaled_z])
         return x
 
     def tell(
@@ -118,8 +118,8 @@ class ARS(Strategy):
             rng,
             (int(self.popsize / 2), self.num_dims),
         )
-        z = jnp.concatenate([z_plus, -1.0 * z_plus])
-        x = state.mean + state.sigma * z
+        scaled_z = state.sigma * z_plus
+        x = jnp.concatenate([state.mean + scaled_z, state.mean - scaled_z])
         return x, state
 
     def tell_strategy(
@@ -162,8 +162,7 @@ class ASEBO(Strategy):
         noise = jax.random.normal(rng, (self.num_dims, int(self.popsize / 2)))
         z_plus = jnp.swapaxes(chol @ noise, 0, 1)
         z_plus /= jnp.linalg.norm(z_plus, axis=-1)[:, jnp.newaxis]
-        z = jnp.concatenate([z_plus, -1.0 * z_plus])
-        x = state.mean + z
+        x = jnp.concatenate([state.mean + z_plus, state.mean - z_plus])
         return x, state.replace(UUT=UUT, UUT_ort=UUT_ort)
 
     def tell_strategy(
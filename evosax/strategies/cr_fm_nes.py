@@ -243,7 +243,7 @@ class CR_FM_NES(Strategy):
         p_c = (1.0 - params.c_c) * state.p_c + jnp.sqrt(
             params.c_c * (2.0 - params.c_c) * params.mu_eff
         ) * wxm / state.sigma
-        mean = state.mean + params.lrate_mean * wxm.squeeze()
+        mean = state.mean + params.lrate_mean * wxm[:, 0]
 
         normv = jnp.linalg.norm(state.v)
         vbar = state.v / normv
@@ -114,13 +114,8 @@ class DE(Strategy):
         """
         # Replace member in archive if performance was improved
         replace = fitness <= state.fitness_archive
-        archive = (
-            jnp.expand_dims(replace, 1) * x
-            + (1 - jnp.expand_dims(replace, 1)) * state.archive
-        )
-        fitness_archive = (
-            replace * fitness + (1 - replace) * state.fitness_archive
-        )
+        archive = jnp.where(replace[:, None], x, state.archive)
+        fitness_archive = jnp.where(replace, fitness, state.fitness_archive)
         # Keep mean across stored archive around for evaluation protocol
         mean = archive.mean(axis=0)
         return state.replace(
@@ -114,10 +114,11 @@ class ESMC(Strategy):
             rng,
             (int(self.popsize / 2), self.num_dims),
         )
-        z = jnp.concatenate(
-            [jnp.zeros((1, self.num_dims)), z_plus, -1.0 * z_plus]
+        scaled_z = z_plus * state.sigma.reshape(1, self.num_dims)
+        # First member evaluates the unperturbed mean
+        x = jnp.concatenate(
+            [state.mean[None], state.mean + scaled_z, state.mean - scaled_z]
         )
-        x = state.mean + z * state.sigma.reshape(1, self.num_dims)
         return x, state
 
     def tell_strategy(
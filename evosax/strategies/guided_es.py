@@ -133,8 +133,7 @@ class GuidedES(Strategy):
         # Antithetic sampling of noise
         z_plus = a * eps_full + c * jnp.dot(Q, eps_subspace)
         z_plus = jnp.swapaxes(z_plus, 0, 1)
-        z = jnp.concatenate([z_plus, -1.0 * z_plus])
-        x = state.mean + z
+        x = jnp.concatenate([state.mean + z_plus, state.mean - z_plus])
         return x, state
 
     @partial(jax.jit, static_argnums=(0,))
@@ -175,11 +175,11 @@ class LGA(Strategy):
         )
         keep_parent = (select_bool.sum(axis=1) == 0)[:, None]
         next_x = select_bool @ x + keep_parent * state.archive_x
-        next_f = select_bool @ fitness + keep_parent.squeeze() * state.archive_f
+        next_f = select_bool @ fitness + keep_parent[:, 0] * state.archive_f
         next_sigma = select_bool @ state.sigma_C + keep_parent * state.archive_sigma
 
         # Update the age counter - reset if copy over otherwise increase
-        next_age = state.archive_age * keep_parent.squeeze() + keep_parent.squeeze()
+        next_age = state.archive_age * keep_parent[:, 0] + keep_parent[:, 0]
 
         # Argsort by performance and set mean
         improved = fit_all[idx][0] < state.best_fitness
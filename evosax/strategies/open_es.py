@@ -54,6 +54,7 @@ class OpenES(Strategy):
             popsize, num_dims, pholder_params, mean_decay, n_devices, **fitness_kwargs
         )
         assert not self.popsize & 1, "Population size must be even"
+        self.half_popsize = self.popsize // 2
         assert opt_name in ["sgd", "adam", "rmsprop", "clipup", "adan"]
         self.optimizer = GradientOptimizer[opt_name](self.num_dims)
         self.strategy_name = "OpenES"
@@ -106,12 +107,14 @@ class OpenES(Strategy):
         if self.use_antithetic_sampling:
             z_plus = jax.random.normal(
                 rng,
-                (int(self.popsize / 2), self.num_dims),
+                (self.half_popsize, self.num_dims),
+            )
+            x = jnp.concatenate(
+                [state.mean + state.sigma * z_plus, state.mean - state.sigma * z_plus]
             )
-            z = jnp.concatenate([z_plus, -1.0 * z_plus])
         else:
             z = jax.random.normal(rng, (self.popsize, self.num_dims))
-        x = state.mean + state.sigma * z
+            x = state.mean + state.sigma * z
         return x, state
 
     def tell_strategy(
@@ -123,8 +126,14 @@ class OpenES(Strategy):
     ) -> EvoState:
         """`tell` performance data for strategy state update."""
         # Reconstruct noise from last mean/std estimates
+        # Use all rows - clipping or foreign populations break antithetic pairs
         noise = (x - state.mean) / state.sigma
-        theta_grad = 1.0 / (self.popsize * state.sigma) * jnp.dot(noise.T, fitness)
+        if not self.use_antithetic_sampling:
+            # Subtract mean fitness baseline to reduce the estimator variance
+            fitness = fitness - fitness.mean()
+        theta_grad = jnp.einsum("nd,n->d", noise, fitness) / (
+            self.popsize * state.sigma
+        )
 
         # Grad update using optimizer instance - decay lrate if desired
         mean, opt_state = self.optimizer.step(
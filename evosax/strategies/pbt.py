@@ -100,11 +100,8 @@ class PBT(Strategy):
     ) -> EvoState:
         """`tell` update to ES state. - Only copy if improved performance."""
         replace = fitness >= state.fitness
-        archive = (
-            jnp.expand_dims(replace, 1) * x
-            + (1 - jnp.expand_dims(replace, 1)) * state.archive
-        )
-        fitness = replace * fitness + (1 - replace) * state.fitness
+        archive = jnp.where(replace[:, None], x, state.archive)
+        fitness = jnp.where(replace, fitness, state.fitness)
         return state.replace(archive=archive, fitness=fitness)
 
 
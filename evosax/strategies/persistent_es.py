@@ -1,4 +1,4 @@
-from typing import Tuple, Optional, Union
+from typing import Any, Tuple, Optional, Union
 import jax
 import jax.numpy as jnp
 import chex
@@ -48,6 +48,7 @@ class PersistentES(Strategy):
         sigma_limit: float = 0.01,
         mean_decay: float = 0.0,
         n_devices: Optional[int] = None,
+        pert_dtype: Any = jnp.float32,
         **fitness_kwargs: Union[bool, int, float]
     ):
         """Persistent ES (Vicol et al., 2021).
@@ -63,9 +64,12 @@ class PersistentES(Strategy):
             **fitness_kwargs
         )
         assert not self.popsize & 1, "Population size must be even"
+        self.half_popsize = self.popsize // 2
         assert opt_name in ["sgd", "adam", "rmsprop", "clipup", "adan"]
         self.optimizer = GradientOptimizer[opt_name](self.num_dims)
         self.strategy_name = "PersistentES"
+        # Storage dtype of the perturbation memory (e.g. jnp.bfloat16)
+        self.pert_dtype = pert_dtype
 
         # Set core kwargs es_params (lrate/sigma schedules)
         self.lrate_init = lrate_init
@@ -102,7 +106,9 @@ class PersistentES(Strategy):
         )
         state = EvoState(
             mean=initialization,
-            pert_accum=jnp.zeros((self.popsize, self.num_dims)),
+            pert_accum=jnp.zeros(
+                (self.popsize, self.num_dims), dtype=self.pert_dtype
+            ),
             opt_state=self.optimizer.initialize(params.opt_params),
             sigma=params.sigma_init,
             inner_step_counter=0,
@@ -116,14 +122,17 @@ class PersistentES(Strategy):
         """`ask` for new proposed candidates to evaluate next."""
         # Generate antithetic perturbations
         pos_perts = (
-            jax.random.normal(rng, (self.popsize // 2, self.num_dims))
+            jax.random.normal(
+                rng, (self.half_popsize, self.num_dims), dtype=self.pert_dtype
+            )
             * state.sigma
         )
-        neg_perts = -pos_perts
-        perts = jnp.concatenate([pos_perts, neg_perts], axis=0)
+        perts = jnp.concatenate([pos_perts, -pos_perts], axis=0)
         # Add the perturbations from this unroll to the perturbation accumulators
-        pert_accum = state.pert_accum + perts
-        x = state.mean + perts
+        pert_accum = state.pert_accum + perts.astype(self.pert_dtype)
+        x = jnp.concatenate(
+            [state.mean + pos_perts, state.mean - pos_perts], axis=0
+        )
         return x, state.replace(pert_accum=pert_accum)
 
     def tell_strategy(
@@ -134,9 +143,14 @@ class PersistentES(Strategy):
         params: EvoParams,
     ) -> EvoState:
         """`tell` update to ES state."""
-        theta_grad = jnp.mean(
-            state.pert_accum * fitness.reshape(-1, 1) / (state.sigma ** 2),
-            axis=0,
+        # Accumulators stay antithetic - only use the first half of the memory
+        # Cast (possibly low precision) memory back for the gradient reduction
+        pert_accum = state.pert_accum[: self.half_popsize].astype(
+            state.mean.dtype
+        )
+        fit_diff = fitness[: self.half_popsize] - fitness[self.half_popsize :]
+        theta_grad = jnp.dot(pert_accum.T, fit_diff) / (
+            self.popsize * state.sigma ** 2
         )
         # Grad update using optimizer instance - decay lrate if desired
         mean, opt_state = self.optimizer.step(
@@ -149,9 +163,8 @@ class PersistentES(Strategy):
         # Reset accumulated antithetic noise memory if done with inner problem
         reset = inner_step_counter >= params.T
         inner_step_counter = jax.lax.select(reset, 0, inner_step_counter)
-        pert_accum = jax.lax.select(
-            reset, jnp.zeros((self.popsize, self.num_dims)), state.pert_accum
-        )
+        # Broadcast scalar zero instead of materializing a zeros buffer
+        pert_accum = jnp.where(reset, 0.0, state.pert_accum)
         return state.replace(
             mean=mean,
             sigma=sigma,
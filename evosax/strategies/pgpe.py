@@ -55,11 +55,13 @@ class PGPE(Strategy):
         super().__init__(
             popsize, num_dims, pholder_params, mean_decay, n_devices, **fitness_kwargs
         )
+        assert not self.popsize & 1, "Population size must be even"
+        self.half_popsize = self.popsize // 2
+
         assert 0 <= elite_ratio <= 1
         self.elite_ratio = elite_ratio
-        self.elite_popsize = max(1, int(self.popsize / 2 * self.elite_ratio))
+        self.elite_popsize = max(1, int(self.half_popsize * self.elite_ratio))
 
-        assert not self.popsize & 1, "Population size must be even"
         assert opt_name in ["sgd", "adam", "rmsprop", "clipup", "adan"]
         self.optimizer = GradientOptimizer[opt_name](self.num_dims)
         self.strategy_name = "PGPE"
@@ -110,10 +112,12 @@ class PGPE(Strategy):
         # Antithetic sampling of noise
         z_plus = jax.random.normal(
             rng,
-            (int(self.popsize / 2), self.num_dims),
+            (self.half_popsize, self.num_dims),
         )
-        z = jnp.hstack([z_plus, -1.0 * z_plus]).reshape(-1, self.num_dims)
-        x = state.mean + state.sigma * z
+        noise = state.sigma * z_plus
+        # Interleave antithetic pairs: [+z_1, -z_1, +z_2, -z_2, ...]
+        x = jnp.stack([state.mean + noise, state.mean - noise], axis=1)
+        x = x.reshape(-1, self.num_dims)
         return x, state
 
     def tell_strategy(
@@ -125,16 +129,17 @@ class PGPE(Strategy):
     ) -> EvoState:
         """Update both mean and dim.-wise isotropic Gaussian scale."""
         # Reconstruct noise from last mean/std estimates
-        scaled_noise = x - state.mean
-        noise_1 = scaled_noise[::2]
+        noise_1 = x[::2] - state.mean
         fit_1 = fitness[::2]
         fit_2 = fitness[1::2]
-        elite_idx = jnp.minimum(fit_1, fit_2).argsort()[: self.elite_popsize]
+        # Partial sort: select pairs with the lowest fitness of either member
+        _, elite_idx = jax.lax.top_k(-jnp.minimum(fit_1, fit_2), self.elite_popsize)
         fitness_elite = jnp.concatenate([fit_1[elite_idx], fit_2[elite_idx]])
+        noise_elite = noise_1[elite_idx]
         fit_diff = fit_1[elite_idx] - fit_2[elite_idx]
-        fit_diff_noise = noise_1[elite_idx] * fit_diff[:, None]
 
-        theta_grad = (0.5 * fit_diff_noise).mean(axis=0)
+        theta_grad = jnp.einsum("nd,n->d", noise_elite, fit_diff)
+        theta_grad = 0.5 * theta_grad / self.elite_popsize
         # Grad update using optimizer instance - decay lrate if desired
         mean, opt_state = self.optimizer.step(
             state.mean, theta_grad, state.opt_state, params.opt_params
@@ -143,12 +148,12 @@ class PGPE(Strategy):
 
         baseline = jnp.mean(fitness_elite)
         all_avg_scores = jnp.stack([fit_1[elite_idx], fit_2[elite_idx]]).sum(axis=0) / 2
-        # Update sigma vector
+        # Update sigma vector - expanded to avoid materializing (noise^2 - sigma^2)
+        score_diff = all_avg_scores - baseline
         delta_sigma = (
-            (jnp.expand_dims(all_avg_scores, axis=1) - baseline)
-            * (noise_1[elite_idx] ** 2 - jnp.expand_dims(state.sigma**2, axis=0))
-            / state.sigma
-        ).mean(axis=0)
+            jnp.einsum("n,nd->d", score_diff, noise_elite**2)
+            - state.sigma**2 * score_diff.sum()
+        ) / (state.sigma * self.elite_popsize)
 
         allowed_delta = jnp.abs(state.sigma) * params.sigma_max_change
         min_allowed = state.sigma - allowed_delta
@@ -14,6 +14,7 @@ class EvoState:
     velocity: chex.Array
     best_archive: chex.Array
     best_archive_fitness: chex.Array
+    global_best: chex.Array  # Best archive member - updated in `tell`
     best_member: chex.Array
     best_fitness: float = jnp.finfo(jnp.float32).max
     gen_counter: int = 0
@@ -73,6 +74,7 @@ class PSO(Strategy):
             best_archive=initialization,
             best_archive_fitness=jnp.zeros(self.popsize)
             + jnp.finfo(jnp.float32).max,
+            global_best=initialization[0],
             best_member=initialization.mean(axis=0),
         )
         return state
@@ -88,21 +90,13 @@ class PSO(Strategy):
           - Social: c_2 * r_2 * (p_(gb)(t) - x_i(t))
         2. Update "particle" positions: x_i(t+1) = x_i(t) + v_i(t+1)
         """
-        rng_members = jax.random.split(rng, self.popsize)
-        member_ids = jnp.arange(self.popsize)
-        vel = jax.vmap(
-            single_member_velocity,
-            in_axes=(0, 0, None, None, None, None, None, None, None),
-        )(
-            rng_members,
-            member_ids,
-            state.archive,
-            state.velocity,
-            state.best_archive,
-            state.best_archive_fitness,
-            params.inertia_coeff,
-            params.cognitive_coeff,
-            params.social_coeff,
+        # Sampling one shared r1, r2 across dims of one member seems more robust!
+        r = jax.random.uniform(rng, (self.popsize, 2))
+        r1, r2 = r[:, :1], r[:, 1:]
+        vel = (
+            params.inertia_coeff * state.velocity
+            + params.cognitive_coeff * r1 * (state.best_archive - state.archive)
+            + params.social_coeff * r2 * (state.global_best - state.archive)
         )
         # Update particle positions with velocity
         x = state.archive + vel
@@ -120,42 +114,16 @@ class PSO(Strategy):
         If fitness of y <= fitness of x -> replace in population.
         """
         replace = fitness <= state.best_archive_fitness
-        best_archive = (
-            jnp.expand_dims(replace, 1) * x
-            + (1 - jnp.expand_dims(replace, 1)) * state.best_archive
-        )
-        best_archive_fitness = (
-            replace * fitness + (1 - replace) * state.best_archive_fitness
+        best_archive = jnp.where(replace[:, None], x, state.best_archive)
+        best_archive_fitness = jnp.where(
+            replace, fitness, state.best_archive_fitness
         )
+        global_best = best_archive[jnp.argmin(best_archive_fitness)]
         return state.replace(
             mean=x.mean(axis=0),
             fitness=fitness,
             archive=x,
             best_archive=best_archive,
             best_archive_fitness=best_archive_fitness,
+            global_best=global_best,
         )
-
-
-def single_member_velocity(
-    rng: chex.PRNGKey,
-    member_id: int,
-    archive: chex.Array,
-    velocity: chex.Array,
-    best_archive: chex.Array,
-    best_fitness: chex.Array,
-    inertia_coeff: float,
-    cognitive_coeff: float,
-    social_coeff: float,
-):
-    """Update v_i(t+1) velocities based on: Inertia, Cognitive, Social."""
-    # Sampling one shared r1, r2 across dims of one member seems more robust!
-    # r1, r2 = jax.random.uniform(rng, (2, archive.shape[1]))
-    r1, r2 = jax.random.uniform(rng, (2,))
-    global_best_id = jnp.argmin(best_fitness)
-    global_best = best_archive[global_best_id]
-    vel_new = (
-        inertia_coeff * velocity[member_id]
-        + cognitive_coeff * r1 * (best_archive[member_id] - archive[member_id])
-        + social_coeff * r2 * (global_best - archive[member_id])
-    )
-    return vel_new
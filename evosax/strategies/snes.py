@@ -1,4 +1,6 @@
 from typing import Tuple, Optional, Union
+import math
+import numpy as np
 import jax
 import jax.numpy as jnp
 import chex
@@ -64,12 +66,21 @@ class SNES(Strategy):
         self.sigma_init = sigma_init
         self.temperature = temperature
 
+        # Default sigma learning rate - Python scalar so nothing lands on device
+        self.lrate_sigma = (3 + math.log(self.num_dims)) / (
+            5 * math.sqrt(self.num_dims)
+        )
+
+        # Rank-based weights only depend on popsize - compute them once
+        # Evaluate eagerly & keep on host so no tracer leaks onto the instance
+        with jax.ensure_compile_time_eval():
+            self.snes_weights = np.asarray(get_snes_weights(self.popsize))
+
     @property
     def params_strategy(self) -> EvoParams:
         """Return default parameters of evolutionary strategy."""
-        lrate_sigma = (3 + jnp.log(self.num_dims)) / (5 * jnp.sqrt(self.num_dims))
         params = EvoParams(
-            lrate_sigma=lrate_sigma,
+            lrate_sigma=self.lrate_sigma,
             sigma_init=self.sigma_init,
             temperature=self.temperature,
         )
@@ -87,7 +98,7 @@ class SNES(Strategy):
         weights = jax.lax.select(
             use_des_weights,
             get_des_weights(self.popsize, params.temperature),
-            get_snes_weights(self.popsize),
+            self.snes_weights,
         )
         state = EvoState(
             mean=initialization,
@@ -116,9 +127,10 @@ class SNES(Strategy):
         """`tell` performance data for strategy state update."""
         s = (x - state.mean) / state.sigma
         ranks = fitness.argsort()
-        sorted_noise = s[ranks]
-        grad_mean = (state.weights * sorted_noise).sum(axis=0)
-        grad_sigma = (state.weights * (sorted_noise**2 - 1)).sum(axis=0)
+        # Scatter rank weights to members instead of gathering the sorted noise
+        weights = jnp.zeros_like(state.weights[:, 0]).at[ranks].set(state.weights[:, 0])
+        grad_mean = jnp.einsum("n,nd->d", weights, s)
+        grad_sigma = jnp.einsum("n,nd->d", weights, s**2 - 1)
         mean = state.mean + params.lrate_mean * state.sigma * grad_mean
         sigma = state.sigma * jnp.exp(params.lrate_sigma / 2 * grad_sigma)
         return state.replace(mean=mean, sigma=sigma)
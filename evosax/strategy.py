@@ -1,7 +1,7 @@
 import jax
 import jax.numpy as jnp
 import chex
-from typing import Tuple, Optional, Union
+from typing import Callable, Tuple, Optional, Union
 from functools import partial
 from flax import struct
 from .utils import get_best_fitness_member
@@ -28,6 +28,12 @@ class EvoParams:
     clip_max: float = jnp.finfo(jnp.float32).max
 
 
+def state_signature(state: EvoState) -> Tuple:
+    """Hashable (treedef, shapes, dtypes) key of a (possibly abstract) state."""
+    leaves, treedef = jax.tree_util.tree_flatten(state)
+    return treedef, tuple((jnp.shape(l), jnp.result_type(l)) for l in leaves)
+
+
 class Strategy(object):
     def __init__(
         self,
@@ -147,6 +153,72 @@ class Strategy(object):
             gen_counter=state.gen_counter + 1,
         )
 
+    @partial(jax.jit, static_argnums=(0, 2, 5))
+    def run(
+        self,
+        rng: chex.PRNGKey,
+        num_iters: int,
+        state: EvoState,
+        params: Optional[EvoParams],
+        eval_fn: Callable[[chex.PRNGKey, chex.ArrayTree], chex.Array],
+    ) -> Tuple[EvoState, chex.Array]:
+        """`lax.scan` through `num_iters` ask-eval-tell generations."""
+        # Use default hyperparameters if no other settings provided
+        if params is None:
+            params = self.default_params
+
+        def step(state: EvoState, rngs: Tuple[chex.PRNGKey, chex.PRNGKey]):
+            """Single ask-eval-tell generation to scan through."""
+            rng_ask, rng_eval = rngs
+            x, state = self.ask(rng_ask, state, params)
+            fitness = eval_fn(rng_eval, x)
+            state = self.tell(x, fitness, state, params)
+            return state, state.best_fitness
+
+        # Pre-split all generation keys at once instead of once per iteration
+        rng_ask, rng_eval = jax.random.split(rng)
+        rngs = (
+            jax.random.split(rng_ask, num_iters),
+            jax.random.split(rng_eval, num_iters),
+        )
+        state, best_fitness = jax.lax.scan(step, state, rngs)
+        return state, best_fitness
+
+    def compile(self, params: Optional[EvoParams] = None) -> Tuple[Callable, Callable]:
+        """AOT-compile `ask` & `tell` for the fixed (popsize, num_dims).
+        Only available for `Strategy` subclasses - the restart wrappers
+        (`IPOP_CMA_ES`, `BIPOP_CMA_ES`) do not provide it."""
+        # Use default hyperparameters if no other settings provided
+        if params is None:
+            params = self.default_params
+
+        # Trace with abstract shapes only - no FLOPs are spent on the dry run
+        rng = jax.ShapeDtypeStruct((2,), jnp.uint32)
+        fitness = jax.ShapeDtypeStruct((self.popsize,), jnp.float32)
+        state = jax.eval_shape(self.initialize, rng, params)
+
+        # Some states (e.g. CMA-ES, SAMR-GA) change shape after the first
+        # generation - unroll abstract generations until the state settles
+        ask_fns, tell_fns = {}, {}
+        while state_signature(state) not in ask_fns:
+            ask_fns[state_signature(state)] = (
+                type(self).ask.lower(self, rng, state, params).compile()
+            )
+            x, state = jax.eval_shape(self.ask, rng, state, params)
+            tell_fns[state_signature(state)] = (
+                type(self).tell.lower(self, x, fitness, state, params).compile()
+            )
+            state = jax.eval_shape(self.tell, x, fitness, state, params)
+
+        # Compiled executables bypass the jit cache & must be called directly
+        def ask(rng, state, params):
+            return ask_fns[state_signature(state)](rng, state, params)
+
+        def tell(x, fitness, state, params):
+            return tell_fns[state_signature(state)](x, fitness, state, params)
+
+        return ask, tell
+
     def initialize_strategy(self, rng: chex.PRNGKey, params: EvoParams) -> EvoState:
         """Search-specific `initialize` method. Returns initial state."""
         raise NotImplementedError
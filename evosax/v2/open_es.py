@@ -121,10 +121,11 @@ class OpenES(DistributedStrategy):
                 rng,
                 (int(self.popsize / 2), self.num_dims),
             )
-            z = jnp.concatenate([z_plus, -1.0 * z_plus])
+            scaled_z = state.sigma * z_plus
+            x = jnp.concatenate([state.mean + scaled_z, state.mean - scaled_z])
         else:
             z = jax.random.normal(rng, (self.popsize, self.num_dims))
-        x = state.mean + state.sigma * z
+            x = state.mean + state.sigma * z
         return x, state
 
     def get_update_strategy(
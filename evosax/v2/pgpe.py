@@ -125,8 +125,10 @@ class PGPE(DistributedStrategy):
             rng,
             (int(self.popsize / 2), self.num_dims),
         )
-        z = jnp.hstack([z_plus, -1.0 * z_plus]).reshape(-1, self.num_dims)
-        x = state.mean + state.sigma * z
+        scaled_z = state.sigma * z_plus
+        # Interleave antithetic pairs: [+z_1, -z_1, +z_2, -z_2, ...]
+        x = jnp.stack([state.mean + scaled_z, state.mean - scaled_z], axis=1)
+        x = x.reshape(-1, self.num_dims)
         return x, state
 
     def get_update_strategy(
@@ -142,22 +144,24 @@ class PGPE(DistributedStrategy):
         noise_1 = scaled_noise[::2]
         fit_1 = fitness[::2]
         fit_2 = fitness[1::2]
-        elite_idx = jnp.minimum(fit_1, fit_2).argsort()[: self.elite_popsize]
+        # Partial sort: select pairs with the lowest fitness of either member
+        _, elite_idx = jax.lax.top_k(-jnp.minimum(fit_1, fit_2), self.elite_popsize)
 
         fitness_elite = jnp.concatenate([fit_1[elite_idx], fit_2[elite_idx]])
+        noise_elite = noise_1[elite_idx]
         fit_diff = fit_1[elite_idx] - fit_2[elite_idx]
-        fit_diff_noise = noise_1[elite_idx] * fit_diff[:, None]
 
-        grad_mean = (0.5 * fit_diff_noise).mean(axis=0)
+        grad_mean = jnp.einsum("nd,n->d", noise_elite, fit_diff)
+        grad_mean = 0.5 * grad_mean / self.elite_popsize
         baseline = jnp.mean(fitness_elite)
         all_avg_scores = jnp.stack([fit_1[elite_idx], fit_2[elite_idx]]).sum(axis=0) / 2
 
-        # Update sigma vector
+        # Update sigma vector - expanded to avoid materializing (noise^2 - sigma^2)
+        score_diff = all_avg_scores - baseline
         delta_sigma = (
-            (jnp.expand_dims(all_avg_scores, axis=1) - baseline)
-            * (noise_1**2 - jnp.expand_dims(state.sigma**2, axis=0))
-            / state.sigma
-        ).mean(axis=0)
+            jnp.einsum("n,nd->d", score_diff, noise_elite**2)
+            - state.sigma**2 * score_diff.sum()
+        ) / (state.sigma * self.elite_popsize)
         return EvoUpdate(grad_mean=grad_mean, delta_sigma=delta_sigma)
 
     def apply_update_strategy(
@@ -1,3 +1,7 @@
+import pytest
+from evosax import Strategies
+
+
 def pytest_addoption(parser):
     parser.addoption("--all", action="store_true", help="run all combinations")
 
@@ -42,9 +46,10 @@ def pytest_generate_tests(metafunc):
                     "HillClimber",
                     "EvoTF_ES",
                 ],
+                scope="session",
             )
         else:
-            metafunc.parametrize("strategy_name", ["LGA"])
+            metafunc.parametrize("strategy_name", ["LGA"], scope="session")
 
     if "classic_name" in metafunc.fixturenames:
         if metafunc.config.getoption("all"):
@@ -94,3 +99,11 @@ def pytest_generate_tests(metafunc):
             )
         else:
             metafunc.parametrize("env_name", ["CartPole-v1"])
+
+
+@pytest.fixture(scope="session")
+def strategy_instance(strategy_name):
+    """Share one strategy (& its compiled ask/tell) across all tests."""
+    # ESMC requires an odd population size (mean is evaluated separately)
+    popsize = 21 if strategy_name == "ESMC" else 20
+    return Strategies[strategy_name](popsize=popsize, num_dims=2)
@@ -1,32 +1,25 @@
 import jax
+import jax.numpy as jnp
 from evosax import Strategies
 from evosax.problems import BBOBFitness
 
 
-def test_strategy_ask(strategy_name):
+def test_strategy_ask(strategy_instance):
     # Loop over all strategies and test ask API
     rng = jax.random.PRNGKey(0)
-    if strategy_name == "ESMC":
-        popsize = 21
-    else:
-        popsize = 20
-    strategy = Strategies[strategy_name](popsize=popsize, num_dims=2)
+    strategy = strategy_instance
     params = strategy.default_params
     state = strategy.initialize(rng, params)
     x, state = strategy.ask(rng, state, params)
-    assert x.shape[0] == popsize
+    assert x.shape[0] == strategy.popsize
     assert x.shape[1] == 2
     return
 
 
-def test_strategy_ask_tell(strategy_name):
+def test_strategy_ask_tell(strategy_instance):
     # Loop over all strategies and test ask API
     rng = jax.random.PRNGKey(0)
-    if strategy_name == "ESMC":
-        popsize = 21
-    else:
-        popsize = 20
-    strategy = Strategies[strategy_name](popsize=popsize, num_dims=2)
+    strategy = strategy_instance
     params = strategy.default_params
     state = strategy.initialize(rng, params)
     x, state = strategy.ask(rng, state, params)
@@ -34,3 +27,61 @@ def test_strategy_ask_tell(strategy_name):
     fitness = evaluator.rollout(rng, x)
     state = strategy.tell(x, fitness, state, params)
     return
+
+
+def test_persistent_es_pert_dtype():
+    # Low precision perturbation memory should survive ask/tell & resets
+    rng = jax.random.PRNGKey(0)
+    evaluator = BBOBFitness("Sphere", num_dims=2)
+    strategy = Strategies["PersistentES"](
+        popsize=20, num_dims=2, pert_dtype=jnp.bfloat16
+    )
+    # Reset the accumulated perturbations every other generation
+    params = strategy.default_params.replace(T=20, K=10)
+    state = strategy.initialize(rng, params)
+    assert state.pert_accum.dtype == jnp.bfloat16
+    for _ in range(4):
+        rng, rng_ask = jax.random.split(rng)
+        x, state = strategy.ask(rng_ask, state, params)
+        assert x.dtype == jnp.float32
+        state = strategy.tell(x, evaluator.rollout(rng, x), state, params)
+        assert state.pert_accum.dtype == jnp.bfloat16
+        assert state.mean.dtype == jnp.float32
+    # Memory was reset at the end of the last inner problem
+    assert state.inner_step_counter == 0
+    assert jnp.all(state.pert_accum == 0)
+
+
+def test_strategy_compile(strategy_instance):
+    # AOT-compiled ask/tell should match the jitted ask/tell calls
+    rng = jax.random.PRNGKey(0)
+    evaluator = BBOBFitness("Sphere", num_dims=2)
+    strategy = strategy_instance
+    params = strategy.default_params
+    ask, tell = strategy.compile(params)
+    state = strategy.initialize(rng, params)
+    state_jit = state
+    for _ in range(3):
+        rng, rng_ask = jax.random.split(rng)
+        x, state = ask(rng_ask, state, params)
+        state = tell(x, evaluator.rollout(rng, x), state, params)
+        x_jit, state_jit = strategy.ask(rng_ask, state_jit, params)
+        fitness_jit = evaluator.rollout(rng, x_jit)
+        state_jit = strategy.tell(x_jit, fitness_jit, state_jit, params)
+    assert jnp.allclose(x, x_jit)
+    assert jnp.allclose(state.best_fitness, state_jit.best_fitness)
+
+
+def test_snes_construct_in_trace():
+    # Constant rank weights must not leak tracers from an enclosing jit
+    strategies = {}
+
+    @jax.jit
+    def build(x):
+        strategies["SNES"] = Strategies["SNES"](popsize=20, num_dims=2)
+        return x
+
+    build(0.0)
+    strategy = strategies["SNES"]
+    state = strategy.initialize(jax.random.PRNGKey(0), strategy.default_params)
+    assert state.weights.shape == (20, 1)
@@ -1,6 +1,5 @@
 import jax
 import jax.numpy as jnp
-from evosax import Strategies
 from evosax.problems import BBOBFitness
 from evosax.core import FitnessShaper
 from functools import partial
@@ -8,20 +7,14 @@ from functools import partial
 num_iters = 25
 
 
-def test_strategy_run(strategy_name):
+def test_strategy_run(strategy_instance):
     # Loop over all strategies and test ask API
     rng = jax.random.PRNGKey(0)
-    Strat = Strategies[strategy_name]
-    # PBT also returns copy ID integer - treat separately
-    if strategy_name == "ESMC":
-        popsize = 21
-    else:
-        popsize = 20
     evaluator = BBOBFitness("Sphere", 2)
     fitness_shaper = FitnessShaper()
 
     batch_eval = evaluator.rollout
-    strategy = Strat(popsize=popsize, num_dims=2)
+    strategy = strategy_instance
     params = strategy.default_params
     state = strategy.initialize(rng, params)
 
@@ -37,20 +30,14 @@ def test_strategy_run(strategy_name):
     # assert fitness[0] >= fitness[-1]
 
 
-def test_strategy_scan(strategy_name):
+def test_strategy_scan(strategy_instance):
     # Loop over all strategies and test ask API
     rng = jax.random.PRNGKey(0)
-    Strat = Strategies[strategy_name]
-    # PBT also returns copy ID integer - treat separately
-    if strategy_name == "ESMC":
-        popsize = 21
-    else:
-        popsize = 20
     evaluator = BBOBFitness("Sphere", 2)
     fitness_shaper = FitnessShaper()
 
     batch_eval = evaluator.rollout
-    strategy = Strat(popsize=popsize, num_dims=2)
+    strategy = strategy_instance
     es_params = strategy.default_params
 
     @partial(jax.jit, static_argnums=(1,))
@@ -73,3 +60,17 @@ def test_strategy_scan(strategy_name):
         return jnp.min(scan_out)
 
     run_plain_es(rng, num_iters)
+
+
+def test_strategy_run_helper(strategy_instance):
+    # Scan through ask-eval-tell loop with the built-in helper
+    rng = jax.random.PRNGKey(0)
+    evaluator = BBOBFitness("Sphere", 2)
+    strategy = strategy_instance
+    es_params = strategy.default_params
+    state = strategy.initialize(rng, es_params)
+    state, best_fitness = strategy.run(
+        rng, num_iters, state, es_params, evaluator.rollout
+    )
+    assert best_fitness.shape == (num_iters,)
+    assert state.gen_counter == num_iters